@@ -1,262 +1,254 @@
 #!/usr/bin/env python3
 
 import sys
-import random
+import collections
 import threading
 import time
 from typing import List, Tuple, Optional
+import numpy as np
+from numba import njit
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTableWidget, QTableWidgetItem, QTextEdit,
     QSpinBox, QGroupBox
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QMutex, QWaitCondition
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont, QColor, QBrush
+
+
+_ACTION_REQUEST, _ACTION_RELEASE, _ACTION_USE = range(3)
+
+_SAFE_STATE_TEMPLATE = """
+def safe_state(available, alloc, need):
+    P = need.shape[0]
+{init_work}
+    pending = np.arange(P).astype(np.int32)
+    remaining = P
+    seq = np.empty(P, np.int32)
+    n = 0
+    changed = True
+    while changed and remaining > 0:
+        kept = 0
+        for k in range(remaining):
+            i = pending[k]
+            if {blocked}:
+                pending[kept] = i
+                kept += 1
+            else:
+{add_work}
+                seq[n] = i
+                n += 1
+        changed = kept < remaining
+        remaining = kept
+    return remaining == 0, seq[:n]
+"""
+
+_safe_state_kernels = {}
+
+
+def _specialized_safe_state(num_resources: int):
+    kernel = _safe_state_kernels.get(num_resources)
+    if kernel is None:
+        source = _SAFE_STATE_TEMPLATE.format(
+            init_work="\n".join(f"    w{j} = available[{j}]" for j in range(num_resources)),
+            blocked=" or ".join(f"need[i, {j}] > w{j}" for j in range(num_resources)),
+            add_work="\n".join(f"                w{j} += alloc[i, {j}]" for j in range(num_resources)),
+        )
+        namespace = {"np": np}
+        exec(source, namespace)
+        kernel = njit(
+            "Tuple((b1, i4[::1]))(i4[::1], i4[:, ::1], i4[:, ::1])", nogil=True
+        )(namespace["safe_state"])
+        _safe_state_kernels[num_resources] = kernel
+    return kernel
 
 
 class Process:
     
-    def __init__(self, pid: int, max_demand: List[int]):
+    __slots__ = ('pid', 'row', 'banker', 'status')
+    
+    def __init__(self, pid: int, banker: "BankerAlgorithm"):
         self.pid = pid
-        self.max_demand = max_demand
-        self.allocation = [0] * len(max_demand)
-        self.need = max_demand.copy()
+        self.row = pid
+        self.banker = banker
         self.status = "Waiting"
-        self.lock = threading.Lock()
         
-    def update_need(self):
-        self.need = [self.max_demand[i] - self.allocation[i] 
-                    for i in range(len(self.max_demand))]
+    # Process state lives in the banker's matrices and is guarded by
+    # BankerAlgorithm.lock; callers must hold it.
+    
+    @property
+    def max_demand(self) -> np.ndarray:
+        return self.banker.max_mat[self.row]
     
-    def _is_finished(self) -> bool:
-        return all(need == 0 for need in self.need)
+    @property
+    def allocation(self) -> np.ndarray:
+        return self.banker.alloc_mat[self.row]
+    
+    @property
+    def need(self) -> np.ndarray:
+        return self.banker.need_mat[self.row]
     
     def is_finished(self) -> bool:
-        with self.lock:
-            return self._is_finished()
+        return not self.need.any()
     
     def get_status(self) -> str:
-        with self.lock:
-            return self.status
+        return self.status
     
     def set_status(self, status: str):
-        with self.lock:
-            self.status = status
+        self.status = status
 
 
 class BankerAlgorithm:
     
     def __init__(self, num_processes: int, num_resources: int, 
-                 available: List[int], processes: List[Process]):
+                 available: List[int], max_demands: List[List[int]]):
         self.num_processes = num_processes
         self.num_resources = num_resources
-        self.available = available.copy()
-        self.processes = processes
+        self.available_arr = np.array(available, dtype=np.int32)
         self.lock = threading.Lock()
         
+        self.max_mat = np.array(max_demands, dtype=np.int32).reshape(num_processes, num_resources)
+        self.alloc_mat = np.zeros_like(self.max_mat)
+        self.need_mat = self.max_mat.copy()
+        self.processes = [Process(i, self) for i in range(num_processes)]
+        self._safe_state = _specialized_safe_state(num_resources)
+        
+        self._last_known_safe, self._last_safe_seq = self._is_safe_state()
+        self._max_snapshot = self.max_mat.copy()
+        self._max_snapshot.setflags(write=False)
+        self._publish_snapshot()
+        
+    def _publish_snapshot(self):
+        # Readers load self.snapshot without the lock; its arrays are frozen
+        # and every change publishes a new tuple, so an unchanged identity
+        # means nothing happened since the last read.
+        available, alloc, need = (self.available_arr.copy(), self.alloc_mat.copy(),
+                                  self.need_mat.copy())
+        for arr in (available, alloc, need):
+            arr.setflags(write=False)
+        self.snapshot = (
+            available, self._max_snapshot, alloc, need,
+            tuple(p.status for p in self.processes),
+            self._last_known_safe, self._last_safe_seq,
+        )
+    
     def _is_safe_state(self) -> Tuple[bool, List[int]]:
-        work = self.available.copy()
-        finish = [False] * self.num_processes
-        safe_sequence = []
-        
-        found = True
-        while found:
-            found = False
-            for i in range(self.num_processes):
-                if not finish[i]:
-                    with self.processes[i].lock:
-                        can_allocate = all(
-                            self.processes[i].need[j] <= work[j]
-                            for j in range(self.num_resources)
-                        )
-                    
-                    if can_allocate:
-                        with self.processes[i].lock:
-                            for j in range(self.num_resources):
-                                work[j] += self.processes[i].allocation[j]
-                        finish[i] = True
-                        safe_sequence.append(i)
-                        found = True
-                        break
-        
-        is_safe = all(finish)
-        return is_safe, safe_sequence
-    
-    def is_safe_state(self) -> Tuple[bool, List[int]]:
+        is_safe, safe_sequence = self._safe_state(self.available_arr, self.alloc_mat, self.need_mat)
+        return bool(is_safe), safe_sequence.tolist()
+    
+    def last_safe_state(self) -> Tuple[bool, List[int]]:
+        with self.lock:
+            return self._last_known_safe, self._last_safe_seq
+    
+    def recompute_safe(self) -> Tuple[bool, List[int]]:
         with self.lock:
-            return self._is_safe_state()
+            result = self._is_safe_state()
+            if result != (self._last_known_safe, self._last_safe_seq):
+                self._last_known_safe, self._last_safe_seq = result
+                self._publish_snapshot()
+            return result
     
     def request_resources(self, process_id: int, request: List[int]) -> Tuple[bool, str]:
+        return self.request_resources_np(process_id, np.asarray(request, dtype=np.int32))
+    
+    def request_resources_np(self, process_id: int, request_arr: np.ndarray) -> Tuple[bool, str]:
         with self.lock:
             process = self.processes[process_id]
+            need_row = self.need_mat[process_id]
+            alloc_row = self.alloc_mat[process_id]
             
-            with process.lock:
-                if any(request[i] > process.need[i] for i in range(self.num_resources)):
-                    return False, f"Process {process_id}: Request exceeds need"
+            if (request_arr > need_row).any():
+                return False, f"Process {process_id}: Request exceeds need"
             
-            if any(request[i] > self.available[i] for i in range(self.num_resources)):
+            if (request_arr > self.available_arr).any():
                 return False, f"Process {process_id}: Insufficient resources available"
             
-            for i in range(self.num_resources):
-                self.available[i] -= request[i]
-                with process.lock:
-                    process.allocation[i] += request[i]
-                    process.need[i] -= request[i]
+            np.subtract(self.available_arr, request_arr, out=self.available_arr)
+            np.add(alloc_row, request_arr, out=alloc_row)
+            np.subtract(need_row, request_arr, out=need_row)
             
-            is_safe, safe_sequence = self._is_safe_state()
+            is_safe, safe_sequence = self._safe_state(self.available_arr, self.alloc_mat, self.need_mat)
             
             if is_safe:
-                with process.lock:
-                    process.update_need()
-                    if process._is_finished():
-                        process.status = "Finished"
-                    else:
-                        process.status = "Running"
-                return True, f"Process {process_id}: Request granted. Safe sequence: {safe_sequence}"
+                if process.is_finished():
+                    process.status = "Finished"
+                else:
+                    process.status = "Running"
+                self._last_known_safe = True
+                self._last_safe_seq = safe_sequence.tolist()
+                self._publish_snapshot()
+                return True, f"Process {process_id}: Request granted. Safe sequence: {self._last_safe_seq}"
             else:
-                for i in range(self.num_resources):
-                    self.available[i] += request[i]
-                    with process.lock:
-                        process.allocation[i] -= request[i]
-                        process.need[i] += request[i]
-                with process.lock:
-                    process.update_need()
-                    process.status = "Waiting"
+                np.add(self.available_arr, request_arr, out=self.available_arr)
+                np.subtract(alloc_row, request_arr, out=alloc_row)
+                np.add(need_row, request_arr, out=need_row)
+                process.status = "Waiting"
+                self._publish_snapshot()
                 return False, f"Process {process_id}: Request denied - unsafe state would result"
     
     def release_resources(self, process_id: int, release: List[int]) -> str:
+        release_arr = np.asarray(release, dtype=np.int32)
+        
         with self.lock:
             process = self.processes[process_id]
+            need_row = self.need_mat[process_id]
+            alloc_row = self.alloc_mat[process_id]
             
-            with process.lock:
-                if any(release[i] > process.allocation[i] for i in range(self.num_resources)):
-                    return f"Process {process_id}: Cannot release more than allocated"
-                
-                for i in range(self.num_resources):
-                    process.allocation[i] -= release[i]
-                    self.available[i] += release[i]
-                
-                process.update_need()
-                
-                if process._is_finished():
-                    process.status = "Finished"
-                else:
-                    process.status = "Running"
-            
-            return f"Process {process_id}: Released resources {release}"
-
-
-class ProcessThread(QThread):
-    
-    action_signal = pyqtSignal(int, str, str)
-    log_signal = pyqtSignal(str)
-    
-    def __init__(self, process_id: int, banker: BankerAlgorithm, 
-                 processes: List[Process], num_resources: int, 
-                 running: threading.Event):
-        super().__init__()
-        self.process_id = process_id
-        self.banker = banker
-        self.processes = processes
-        self.num_resources = num_resources
-        self.running = running
-        self.paused = threading.Event()
-        self.paused.set()
-        
-    def run(self):
-        process = self.processes[self.process_id]
-        max_iterations = 1000
-        iteration = 0
-        
-        while self.running.is_set() and iteration < max_iterations:
-            self.paused.wait()
-            
-            if not self.running.is_set():
-                break
+            if (release_arr > alloc_row).any():
+                return f"Process {process_id}: Cannot release more than allocated"
             
-            iteration += 1
+            np.subtract(alloc_row, release_arr, out=alloc_row)
+            np.add(self.available_arr, release_arr, out=self.available_arr)
+            np.add(need_row, release_arr, out=need_row)
             
             if process.is_finished():
-                time.sleep(0.3)
-                continue
-            
-            action = random.choice(['request', 'release', 'use'])
-            
-            if action == 'request':
-                request = []
-                for i in range(self.num_resources):
-                    with process.lock:
-                        need_val = process.need[i]
-                    
-                    if need_val > 0:
-                        with self.banker.lock:
-                            available = self.banker.available[i]
-                        
-                        if available > 0:
-                            max_request = min(need_val, available)
-                            if max_request > 0:
-                                request_value = random.randint(1, max_request)
-                                request.append(request_value)
-                            else:
-                                request.append(0)
-                        else:
-                            request.append(0)
-                    else:
-                        request.append(0)
-                
-                if any(r > 0 for r in request):
-                    success, message = self.banker.request_resources(self.process_id, request)
-                    self.log_signal.emit(message)
-                    self.action_signal.emit(self.process_id, 'request', 'granted' if success else 'denied')
-                else:
-                    with process.lock:
-                        if any(process.need[i] > 0 for i in range(self.num_resources)):
-                            self.log_signal.emit(f"Process {self.process_id}: Waiting for resources...")
+                process.status = "Finished"
+            else:
+                process.status = "Running"
             
-            elif action == 'release':
-                with process.lock:
-                    release = []
-                    for i in range(self.num_resources):
-                        if process.allocation[i] > 0:
-                            release_value = random.randint(1, process.allocation[i])
-                            release.append(release_value)
-                        else:
-                            release.append(0)
-                
-                if any(r > 0 for r in release):
-                    message = self.banker.release_resources(self.process_id, release)
-                    self.log_signal.emit(message)
-                    self.action_signal.emit(self.process_id, 'release', 'success')
+            # A release cannot turn a safe state unsafe, and the previous
+            # safe sequence stays valid, so only an unsafe verdict is rechecked.
+            if not self._last_known_safe:
+                self._last_known_safe, self._last_safe_seq = self._is_safe_state()
             
-            elif action == 'use':
-                with process.lock:
-                    if process.status == "Running" and any(process.allocation[i] > 0 for i in range(self.num_resources)):
-                        self.log_signal.emit(f"Process {self.process_id}: Using resources...")
-                        self.action_signal.emit(self.process_id, 'use', 'success')
+            self._publish_snapshot()
             
-            time.sleep(random.uniform(0.3, 0.8))
-    
-    def pause(self):
-        self.paused.clear()
-    
-    def resume(self):
-        self.paused.set()
+            return f"Process {process_id}: Released resources {release}"
 
 
 class MainWindow(QMainWindow):
     
+    _GREEN_LT = QColor(200, 255, 200)
+    _RED_LT = QColor(255, 200, 200)
+    _GREEN_RUN = QColor(144, 238, 144)
+    _PINK_WAIT = QColor(255, 182, 193)
+    _BLUE_FIN = QColor(173, 216, 230)
+    _NO_BRUSH = QBrush()
+    
     def __init__(self):
         super().__init__()
         self.num_processes = 5
         self.num_resources = 4
         self.processes: List[Process] = []
         self.banker: Optional[BankerAlgorithm] = None
-        self.process_threads: List[ProcessThread] = []
-        self.running = threading.Event()
+        self.simulation_active = False
+        self._rendered_snapshot = None
+        self.max_iterations = 1000
+        self.rng = np.random.default_rng()
+        self.next_wake = np.zeros(self.num_processes)
+        self.iterations = np.zeros(self.num_processes, dtype=np.int64)
+        self.sim_timer = QTimer()
+        self.sim_timer.timeout.connect(self.simulation_tick)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_tables)
         self.check_completion_timer = QTimer()
         self.check_completion_timer.timeout.connect(self.check_all_processes_finished)
+        self.safety_timer = QTimer()
+        self.safety_timer.timeout.connect(self.verify_safe_state)
+        self.log_queue = collections.deque()
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.timeout.connect(self._flush_logs)
+        self.log_flush_timer.start(200)
         
         self.pink_light = QColor(255, 228, 225)
         self.pink_medium = QColor(255, 192, 203)
@@ -473,42 +465,59 @@ class MainWindow(QMainWindow):
         
         main_layout.addLayout(content_layout)
         
+        self._available_items = self._init_table_items(self.available_table, 1, self.num_resources)
+        self._max_items = self._init_table_items(self.max_table, self.num_processes, self.num_resources)
+        self._alloc_items = self._init_table_items(self.alloc_table, self.num_processes, self.num_resources)
+        self._need_items = self._init_table_items(self.need_table, self.num_processes, self.num_resources)
+        self._status_items = self._init_table_items(self.status_table, self.num_processes, 2)
+        for i in range(self.num_processes):
+            self._status_items[i][0].setText(f"Process {i}")
+        
+        self._available_shadow = [None] * self.num_resources
+        self._max_shadow = [[None] * self.num_resources for _ in range(self.num_processes)]
+        self._alloc_shadow = [[None] * self.num_resources for _ in range(self.num_processes)]
+        self._need_shadow = [[None] * self.num_resources for _ in range(self.num_processes)]
+        self._status_shadow = [None] * self.num_processes
+        
         self.statusBar().showMessage("Ready to start simulation")
         self.statusBar().setStyleSheet(f"background-color: {self.pink_light.name()};")
         
         QTimer.singleShot(100, self.setup_initial_state)
     
+    def _init_table_items(self, table: QTableWidget, rows: int, cols: int) -> List[List[QTableWidgetItem]]:
+        items = []
+        for i in range(rows):
+            row = []
+            for j in range(cols):
+                item = QTableWidgetItem("")
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(i, j, item)
+                row.append(item)
+            items.append(row)
+        return items
+    
     def setup_initial_state(self):
         self.reset_simulation()
     
     def generate_random_max_demand(self, total_resources: List[int]) -> List[List[int]]:
-        max_demands = []
-        for process_idx in range(self.num_processes):
-            demand = []
-            for res_idx in range(self.num_resources):
-                max_possible = total_resources[res_idx]
-                upper_limit = min(max_possible, max(1, max_possible * 2 // 3))
-                value = random.randint(0, upper_limit)
-                demand.append(value)
-            
-            if all(d == 0 for d in demand):
-                demand[random.randint(0, self.num_resources - 1)] = 1
-            
-            max_demands.append(demand)
+        total = np.array(total_resources)
+        upper_limits = np.minimum(total, np.maximum(1, total * 2 // 3))
+        max_demands = self.rng.integers(
+            0, upper_limits + 1, size=(self.num_processes, self.num_resources)
+        )
         
-        for res_idx in range(self.num_resources):
-            total_demand = sum(max_demands[i][res_idx] for i in range(self.num_processes))
-            max_allowed = total_resources[res_idx] * self.num_processes // 2
-            
-            if total_demand > max_allowed:
-                scale_factor = max_allowed / total_demand if total_demand > 0 else 1
-                for i in range(self.num_processes):
-                    max_demands[i][res_idx] = max(0, int(max_demands[i][res_idx] * scale_factor))
+        empty = max_demands.sum(axis=1) == 0
+        max_demands[empty, self.rng.integers(0, self.num_resources, size=empty.sum())] = 1
+        
+        total_demand = max_demands.sum(axis=0)
+        max_allowed = total * self.num_processes // 2
+        scale = np.where(total_demand > max_allowed,
+                         max_allowed / np.maximum(total_demand, 1), 1.0)
         
-        return max_demands
+        return (max_demands * scale).astype(np.int32).tolist()
     
     def initial_safe_allocation(self):
-        is_safe, seq = self.banker.is_safe_state()
+        is_safe, seq = self.banker.last_safe_state()
         if not is_safe or not seq:
             return
         
@@ -519,18 +528,20 @@ class MainWindow(QMainWindow):
             process_id = seq[idx]
             process = self.processes[process_id]
             
+            with self.banker.lock:
+                need = process.need.tolist()
+                available = self.banker.available_arr.tolist()
+            
             request = []
             for res_idx in range(self.num_resources):
-                with process.lock:
-                    need_val = process.need[res_idx]
+                need_val = need[res_idx]
                 
                 if need_val > 0:
-                    with self.banker.lock:
-                        available_val = self.banker.available[res_idx]
+                    available_val = available[res_idx]
                     
                     if available_val > 0:
                         max_possible = min(need_val, available_val)
-                        amount = random.randint(1, max_possible)
+                        amount = int(self.rng.integers(1, max_possible + 1))
                         request.append(amount)
                     else:
                         request.append(0)
@@ -541,29 +552,24 @@ class MainWindow(QMainWindow):
                 success, _ = self.banker.request_resources(process_id, request)
     
     def reset_simulation(self):
-        self.stop_all_threads()
-        
-        self.running = threading.Event()
+        self.stop_simulation()
         
         total_resources = [sb.value() for sb in self.resource_spinboxes]
         
         max_demands = self.generate_random_max_demand(total_resources)
         
-        self.processes = [
-            Process(i, max_demands[i])
-            for i in range(self.num_processes)
-        ]
-        
         self.banker = BankerAlgorithm(
             self.num_processes,
             self.num_resources,
             total_resources.copy(),
-            self.processes
+            max_demands
         )
+        self.processes = self.banker.processes
         
         self.initial_safe_allocation()
         
         self.update_tables()
+        self.log_queue.clear()
         self.log_text.clear()
         self.log_text.append("=== Simulation Reset ===\n")
         self.log_text.append(f"Total Resources: {total_resources}\n")
@@ -573,7 +579,7 @@ class MainWindow(QMainWindow):
         for i, demand in enumerate(max_demands):
             self.log_text.append(f"  Process {i}: {demand}\n")
         
-        is_safe, safe_sequence = self.banker.is_safe_state()
+        is_safe, safe_sequence = self.banker.last_safe_state()
         if is_safe:
             self.log_text.append(f"\nInitial state is SAFE.\n")
             self.log_text.append(f"Safe sequence: {safe_sequence}\n")
@@ -587,111 +593,172 @@ class MainWindow(QMainWindow):
         self.pause_btn.setEnabled(False)
         self.resume_btn.setEnabled(False)
         self.statusBar().showMessage("Simulation reset. Ready to start.")
+        self._rendered_snapshot = None
     
-    def stop_all_threads(self):
-        if self.process_threads:
-            self.running.clear()
-            for thread in self.process_threads:
-                if thread.isRunning():
-                    thread.resume()
-                    thread.wait(2000)
-                    if thread.isRunning():
-                        thread.terminate()
-                        thread.wait()
-            self.process_threads.clear()
+    def stop_simulation(self):
+        self.simulation_active = False
+        
+        if self.sim_timer.isActive():
+            self.sim_timer.stop()
         
         if self.update_timer.isActive():
             self.update_timer.stop()
         
         if self.check_completion_timer.isActive():
             self.check_completion_timer.stop()
+        
+        if self.safety_timer.isActive():
+            self.safety_timer.stop()
     
     def start_simulation(self):
         if not self.banker:
             return
         
-        if self.process_threads:
+        if self.simulation_active:
             return
         
-        self.running.set()
+        self.simulation_active = True
+        self.next_wake = np.zeros(self.num_processes)
+        self.iterations = np.zeros(self.num_processes, dtype=np.int64)
         
-        self.process_threads = []
-        for i in range(self.num_processes):
-            thread = ProcessThread(
-                i,
-                self.banker,
-                self.processes,
-                self.num_resources,
-                self.running
-            )
-            thread.log_signal.connect(self.add_log)
-            thread.action_signal.connect(self.on_process_action)
-            self.process_threads.append(thread)
-            thread.start()
+        shape = (self.num_processes, self.max_iterations)
+        self.actions = self.rng.integers(0, 3, size=shape).tolist()
+        self.sleeps = self.rng.uniform(0.3, 0.8, size=shape)
+        self.req_rand = self.rng.random(size=shape + (self.num_resources,))
+        self.rel_rand = self.rng.random(size=shape + (self.num_resources,))
         
+        self.sim_timer.start(50)
         self.update_timer.start(300)
         self.check_completion_timer.start(1000)
+        self.safety_timer.start(1000)
         
         self.start_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
         self.resume_btn.setEnabled(False)
         self.statusBar().showMessage("Simulation running...")
+        self._rendered_snapshot = None
         
         self.add_log("=== Simulation Started ===")
     
+    def simulation_tick(self):
+        now = time.monotonic()
+        due = np.flatnonzero((self.next_wake <= now) & (self.iterations < self.max_iterations))
+        if not due.size:
+            return
+        
+        for i in due.tolist():
+            iteration = int(self.iterations[i])
+            self.iterations[i] += 1
+            self.next_wake[i] = now + self.run_process_action(i, iteration)
+        
+        self.update_tables()
+    
+    def run_process_action(self, process_id: int, iteration: int) -> float:
+        process = self.processes[process_id]
+        
+        with self.banker.lock:
+            finished = process.is_finished()
+            need = process.need.copy()
+            allocation = process.allocation.tolist()
+            available = self.banker.available_arr.copy()
+            status = process.status
+        
+        if finished:
+            return 0.3
+        
+        action = self.actions[process_id][iteration]
+        req_rand = self.req_rand[process_id, iteration]
+        rel_rand = self.rel_rand[process_id, iteration]
+        
+        if action == _ACTION_REQUEST:
+            cap = np.minimum(need, available)
+            request = np.where(cap > 0, 1 + (req_rand * cap).astype(np.int32), 0).astype(np.int32)
+            
+            if request.any():
+                success, message = self.banker.request_resources_np(process_id, request)
+                self.add_log(message)
+            else:
+                if need.any():
+                    self.add_log(f"Process {process_id}: Waiting for resources...")
+        
+        elif action == _ACTION_RELEASE:
+            release = []
+            for i in range(self.num_resources):
+                if allocation[i] > 0:
+                    release_value = 1 + int(rel_rand[i] * allocation[i])
+                    release.append(release_value)
+                else:
+                    release.append(0)
+            
+            if any(r > 0 for r in release):
+                message = self.banker.release_resources(process_id, release)
+                self.add_log(message)
+        
+        elif action == _ACTION_USE:
+            if status == "Running" and any(allocation[i] > 0 for i in range(self.num_resources)):
+                self.add_log(f"Process {process_id}: Using resources...")
+        
+        return float(self.sleeps[process_id, iteration])
+    
     def pause_simulation(self):
-        if self.process_threads:
-            for thread in self.process_threads:
-                if thread.isRunning():
-                    thread.pause()
+        if self.simulation_active:
+            self.sim_timer.stop()
             self.update_timer.stop()
             self.check_completion_timer.stop()
+            self.safety_timer.stop()
             self.pause_btn.setEnabled(False)
             self.resume_btn.setEnabled(True)
             self.statusBar().showMessage("Simulation paused")
             self.add_log("=== Simulation Paused ===")
     
     def resume_simulation(self):
-        if self.process_threads:
-            for thread in self.process_threads:
-                if thread.isRunning():
-                    thread.resume()
+        if self.simulation_active:
+            self.sim_timer.start(50)
             self.update_timer.start(300)
             self.check_completion_timer.start(1000)
+            self.safety_timer.start(1000)
             self.pause_btn.setEnabled(True)
             self.resume_btn.setEnabled(False)
             self.statusBar().showMessage("Simulation running...")
+            self._rendered_snapshot = None
             self.add_log("=== Simulation Resumed ===")
     
-    def on_process_action(self, process_id: int, action: str, result: str):
-        self.update_tables()
-    
     def check_all_processes_finished(self):
-        if not self.processes or not self.process_threads:
+        if not self.processes or not self.simulation_active:
             return
         
         all_finished = True
-        for process in self.processes:
-            if not process.is_finished():
-                all_finished = False
-                break
+        with self.banker.lock:
+            for process in self.processes:
+                if not process.is_finished():
+                    all_finished = False
+                    break
         
         if all_finished:
-            self.stop_all_threads()
+            self.stop_simulation()
             self.start_btn.setEnabled(True)
             self.pause_btn.setEnabled(False)
             self.resume_btn.setEnabled(False)
             self.statusBar().showMessage("All processes finished!")
             self.add_log("=== All Processes Finished ===")
             
-            is_safe, safe_sequence = self.banker.is_safe_state()
+            is_safe, safe_sequence = self.banker.last_safe_state()
             if is_safe:
                 self.add_log(f"Final state is SAFE. Safe sequence: {safe_sequence}")
             else:
                 self.add_log("Final state is UNSAFE!")
     
     def add_log(self, message: str):
-        self.log_text.append(message)
+        self.log_queue.append(message)
+    
+    def _flush_logs(self, max_batch: int = 500):
+        batch = []
+        while self.log_queue and len(batch) < max_batch:
+            batch.append(self.log_queue.popleft())
+        if not batch:
+            return
+        
+        self.log_text.append('\n'.join(batch))
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
@@ -699,65 +766,75 @@ class MainWindow(QMainWindow):
         if not self.banker:
             return
         
-        with self.banker.lock:
-            available = self.banker.available.copy()
+        snapshot = self.banker.snapshot
+        if snapshot is self._rendered_snapshot:
+            return
+        self._rendered_snapshot = snapshot
+        
+        available_arr, max_mat, alloc_mat, need_mat, statuses, is_safe, safe_sequence = snapshot
+        available = available_arr.tolist()
+        max_rows = max_mat.tolist()
+        alloc_rows = alloc_mat.tolist()
+        need_rows = need_mat.tolist()
         
         for i in range(self.num_resources):
-            item = QTableWidgetItem(str(available[i]))
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.available_table.setItem(0, i, item)
+            if available[i] != self._available_shadow[i]:
+                self._available_items[0][i].setText(str(available[i]))
+                self._available_shadow[i] = available[i]
         
         for i in range(self.num_processes):
-            with self.processes[i].lock:
-                max_demand = self.processes[i].max_demand.copy()
-                allocation = self.processes[i].allocation.copy()
-                need = self.processes[i].need.copy()
-                status = self.processes[i].status
+            max_demand, allocation, need, status = max_rows[i], alloc_rows[i], need_rows[i], statuses[i]
             
             for j in range(self.num_resources):
-                item = QTableWidgetItem(str(max_demand[j]))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.max_table.setItem(i, j, item)
+                if max_demand[j] != self._max_shadow[i][j]:
+                    self._max_items[i][j].setText(str(max_demand[j]))
+                    self._max_shadow[i][j] = max_demand[j]
             
             for j in range(self.num_resources):
-                item = QTableWidgetItem(str(allocation[j]))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if allocation[j] > 0:
-                    item.setBackground(QColor(200, 255, 200))
-                self.alloc_table.setItem(i, j, item)
+                if allocation[j] != self._alloc_shadow[i][j]:
+                    item = self._alloc_items[i][j]
+                    item.setText(str(allocation[j]))
+                    if allocation[j] > 0:
+                        item.setBackground(self._GREEN_LT)
+                    else:
+                        item.setBackground(self._NO_BRUSH)
+                    self._alloc_shadow[i][j] = allocation[j]
             
             for j in range(self.num_resources):
-                item = QTableWidgetItem(str(need[j]))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if need[j] > 0:
-                    item.setBackground(QColor(255, 200, 200))
-                else:
-                    item.setBackground(QColor(200, 255, 200))
-                self.need_table.setItem(i, j, item)
-            
-            pid_item = QTableWidgetItem(f"Process {i}")
-            pid_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.status_table.setItem(i, 0, pid_item)
-            
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            if status == "Running":
-                status_item.setBackground(QColor(144, 238, 144))
-            elif status == "Waiting":
-                status_item.setBackground(QColor(255, 182, 193))
-            elif status == "Finished":
-                status_item.setBackground(QColor(173, 216, 230))
+                if need[j] != self._need_shadow[i][j]:
+                    item = self._need_items[i][j]
+                    item.setText(str(need[j]))
+                    if need[j] > 0:
+                        item.setBackground(self._RED_LT)
+                    else:
+                        item.setBackground(self._GREEN_LT)
+                    self._need_shadow[i][j] = need[j]
             
-            self.status_table.setItem(i, 1, status_item)
+            if status != self._status_shadow[i]:
+                status_item = self._status_items[i][1]
+                status_item.setText(status)
+                
+                if status == "Running":
+                    status_item.setBackground(self._GREEN_RUN)
+                elif status == "Waiting":
+                    status_item.setBackground(self._PINK_WAIT)
+                elif status == "Finished":
+                    status_item.setBackground(self._BLUE_FIN)
+                
+                self._status_shadow[i] = status
         
-        is_safe, safe_sequence = self.banker.is_safe_state()
         if is_safe:
-            self.statusBar().showMessage(
-                f"State is SAFE. Safe sequence: {safe_sequence}"
-            )
+            message = f"State is SAFE. Safe sequence: {safe_sequence}"
         else:
-            self.statusBar().showMessage("State is UNSAFE - potential deadlock!")
+            message = "State is UNSAFE - potential deadlock!"
+        if message != self.statusBar().currentMessage():
+            self.statusBar().showMessage(message)
+    
+    def verify_safe_state(self):
+        if not self.banker:
+            return
+        
+        self.banker.recompute_safe()
 
 
 def main():
@@ -766,6 +843,9 @@ def main():
     app.setStyle('Fusion')
     
     window = MainWindow()
+    # Compile the safety kernel (~1 s, not disk-cacheable) before the window
+    # appears, so the first reset does not freeze a visible UI.
+    _specialized_safe_state(window.num_resources)
     window.show()
     window.raise_()
     window.activateWindow()